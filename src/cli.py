@@ -3,14 +3,31 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import sys
 from pathlib import Path
+from typing import TextIO
 
-from .comparison_agent import generate_comparison_selects
-from .metadata import TableMetadata
+from . import __version__
 
 
-def main() -> int:
+def _write_comparison(
+    f: TextIO, source_name: str, source_sql: str, target_name: str, target_sql: str
+) -> None:
+    """Write both commented SELECTs piecewise instead of building one combined string."""
+    f.write("-- Source table: ")
+    f.write(source_name)
+    f.write("\n")
+    f.write(source_sql)
+    f.write("\n\n-- Target table: ")
+    f.write(target_name)
+    f.write("\n")
+    f.write(target_sql)
+    f.write("\n")
+
+
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Generate two SELECT statements to compare source and target tables from metadata files."
     )
@@ -36,7 +53,7 @@ def main() -> int:
     )
     parser.add_argument(
         "--dialect",
-        choices=["ansi", "sqlserver", "mssql", "mysql"],
+        choices=("ansi", "sqlserver", "mssql", "mysql"),
         default="ansi",
         help="SQL dialect for identifiers (default: ansi)",
     )
@@ -45,13 +62,32 @@ def main() -> int:
         action="store_true",
         help="Use quoted identifiers (ANSI double-quote style)",
     )
+    parser.add_argument(
+        "-V",
+        "--version",
+        action="version",
+        version=__version__,
+    )
     parser.add_argument(
         "-o",
         "--output",
         type=Path,
         help="Write SQL to file (default: stdout)",
     )
-    args = parser.parse_args()
+    return parser
+
+
+def main() -> int:
+    # Answer --version before building the parser.
+    if len(sys.argv) == 2 and sys.argv[1] in ("-V", "--version"):
+        print(__version__)
+        return 0
+
+    args = _build_parser().parse_args()
+
+    # Deferred so --help and argument errors don't pay for loading the agent.
+    from .comparison_agent import generate_comparison_selects
+    from .metadata import TableMetadata
 
     try:
         source = TableMetadata.load(args.source_metadata)
@@ -76,12 +112,16 @@ def main() -> int:
         print(f"Error: {e}", file=sys.stderr)
         return 1
 
-    out = f"-- Source table: {source.qualified_name}\n{source_sql}\n\n-- Target table: {target.qualified_name}\n{target_sql}\n"
     if args.output:
-        args.output.write_text(out, encoding="utf-8")
+        with args.output.open("w", encoding="utf-8") as f:
+            _write_comparison(f, source.qualified_name, source_sql, target.qualified_name, target_sql)
         print(f"Wrote comparison SQL to {args.output}", file=sys.stderr)
     else:
-        print(out)
+        _write_comparison(
+            sys.stdout, source.qualified_name, source_sql, target.qualified_name, target_sql
+        )
+        # Trailing blank line, matching the previous print() output
+        sys.stdout.write("\n")
     return 0
 
 
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Callable, Sequence
+
 from .metadata import TableMetadata
 
 
@@ -17,24 +19,89 @@ def align_columns(
     - use_intersection=False: all columns from source; target SELECT uses same order,
       missing columns as NULL.
     """
-    src_names = set(source.column_names)
-    tgt_names = set(target.column_names)
     if use_intersection:
-        common = src_names & tgt_names
+        tgt_set = frozenset(target.column_names)
         # Preserve source table column order for consistency
-        return [c for c in source.column_names if c in common]
-    return source.column_names
+        return [c for c in source.column_names if c in tgt_set]
+    return list(source.column_names)
+
+
+# (prefix, suffix) wrapped around identifiers per dialect; unknown dialects are left bare
+_QUOTE_WRAPPERS: dict[str, tuple[str, str]] = {
+    "ansi": ("", ""),
+    "ansi_quoted": ('"', '"'),
+    "sqlserver": ("[", "]"),
+    "mssql": ("[", "]"),
+    "mysql": ("`", "`"),
+}
+_NO_QUOTES = ("", "")
+
+# Getter for the qualified table name per dialect (default: plain schema.table);
+# quoted identifiers always use TableMetadata.quoted_qualified_name
+_QUALIFIED_NAME_GETTERS: dict[str, Callable[[TableMetadata], str]] = {
+    "sqlserver": TableMetadata.sqlserver_qualified_name.fget,
+}
 
 
 def quote_identifier(name: str, dialect: str = "ansi") -> str:
     """Quote identifier for SQL (e.g. reserved words, case)."""
-    if dialect == "ansi" or dialect == "ansi_quoted":
-        return f'"{name}"' if dialect == "ansi_quoted" else name
-    if dialect in ("sqlserver", "mssql"):
-        return f"[{name}]"
-    if dialect == "mysql":
-        return f"`{name}`"
-    return name
+    pre, post = _QUOTE_WRAPPERS.get(dialect, _NO_QUOTES)
+    return f"{pre}{name}{post}"
+
+
+_DIALECTS = ("ansi", "sqlserver", "mssql", "mysql")
+
+_SelectBuilder = Callable[[Sequence[TableMetadata], list[str], list[str] | None], list[str]]
+
+
+def _make_builder(dialect: str, use_quoted_identifiers: bool) -> _SelectBuilder:
+    """
+    Specialize SELECT generation for one (dialect, quoted) combination.
+
+    The returned builder emits one SELECT per table over the same column lists, so
+    identifiers are quoted once no matter how many tables are built.
+    """
+    pre, post = _QUOTE_WRAPPERS.get(
+        "ansi_quoted" if use_quoted_identifiers else dialect, _NO_QUOTES
+    )
+    qualified_name = (
+        TableMetadata.quoted_qualified_name.fget
+        if use_quoted_identifiers
+        else _QUALIFIED_NAME_GETTERS.get(dialect, TableMetadata.qualified_name.fget)
+    )
+
+    def build(
+        tables: Sequence[TableMetadata],
+        columns: list[str],
+        order_by_columns: list[str] | None,
+    ) -> list[str]:
+        # Quote each column once; ORDER BY columns are normally a subset of these
+        quoted_map = {c: f"{pre}{c}{post}" for c in columns}
+        select_list = ", ".join([quoted_map[c] for c in columns])
+        order_clause = ""
+        if order_by_columns:
+            order_clause = "\nORDER BY " + ", ".join(
+                [quoted_map[c] if c in quoted_map else f"{pre}{c}{post}" for c in order_by_columns]
+            )
+        return [
+            "".join(("SELECT ", select_list, "\nFROM ", qualified_name(t), order_clause))
+            for t in tables
+        ]
+
+    return build
+
+
+_BUILDERS: dict[tuple[str, bool], _SelectBuilder] = {
+    (d, q): _make_builder(d, q) for d in _DIALECTS for q in (False, True)
+}
+
+
+def _get_builder(dialect: str, use_quoted_identifiers: bool) -> _SelectBuilder:
+    builder = _BUILDERS.get((dialect, use_quoted_identifiers))
+    if builder is None:
+        # Dialects outside _DIALECTS are left unquoted, as quote_identifier does
+        builder = _make_builder(dialect, use_quoted_identifiers)
+    return builder
 
 
 def build_select(
@@ -45,23 +112,8 @@ def build_select(
     use_quoted_identifiers: bool = False,
 ) -> str:
     """Build a single SELECT statement for the given table and column list."""
-    quote = (
-        (lambda c: quote_identifier(c, "ansi_quoted"))
-        if use_quoted_identifiers
-        else (lambda c: quote_identifier(c, dialect))
-    )
-    qualified = table.qualified_name
-    if use_quoted_identifiers and table.schema_name:
-        qualified = f'"{table.schema_name}"."{table.table_name}"'
-    elif dialect == "sqlserver" and table.schema_name:
-        qualified = f"[{table.schema_name}].[{table.table_name}]"
-
-    select_list = ", ".join(quote(c) for c in columns)
-    sql = f"SELECT {select_list}\nFROM {qualified}"
-    if order_by_columns:
-        order_list = ", ".join(quote(c) for c in order_by_columns)
-        sql += f"\nORDER BY {order_list}"
-    return sql
+    build = _get_builder(dialect, use_quoted_identifiers)
+    return build((table,), columns, order_by_columns)[0]
 
 
 def generate_comparison_selects(
@@ -84,30 +136,20 @@ def generate_comparison_selects(
     if not columns:
         raise ValueError(
             "No common columns between source and target. "
-            f"Source: {source_metadata.column_names}, Target: {target_metadata.column_names}"
+            f"Source: {list(source_metadata.column_names)}, "
+            f"Target: {list(target_metadata.column_names)}"
         )
 
     order_cols: list[str] | None = None
     if order_by_keys:
-        src_keys = source_metadata.key_columns
-        tgt_keys = target_metadata.key_columns
+        keys = source_metadata.key_columns or target_metadata.key_columns
         # Use key columns that are in our selected column list
-        order_cols = [k for k in (src_keys or tgt_keys) if k in columns]
+        columns_set = frozenset(columns)
+        order_cols = [k for k in keys if k in columns_set]
         if not order_cols and columns:
             order_cols = columns[:1]
 
-    source_sql = build_select(
-        source_metadata,
-        columns,
-        order_by_columns=order_cols,
-        dialect=dialect,
-        use_quoted_identifiers=use_quoted_identifiers,
-    )
-    target_sql = build_select(
-        target_metadata,
-        columns,
-        order_by_columns=order_cols,
-        dialect=dialect,
-        use_quoted_identifiers=use_quoted_identifiers,
-    )
+    # Both SELECTs share the same column lists; only the table differs
+    build = _get_builder(dialect, use_quoted_identifiers)
+    source_sql, target_sql = build((source_metadata, target_metadata), columns, order_cols)
     return source_sql, target_sql
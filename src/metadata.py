@@ -2,13 +2,39 @@
 
 from __future__ import annotations
 
-import json
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # optional speedup; stdlib json also accepts bytes
+    from json import loads as _json_loads
 
-@dataclass
+# Parsed JSON keyed by (resolved path, mtime_ns, size) so repeated loads skip re-parsing.
+# Each load builds a fresh TableMetadata from it, so callers never share instances.
+_LOAD_CACHE: dict[tuple[str, int, int], dict[str, Any]] = {}
+_LOAD_CACHE_MAXSIZE = 64
+
+
+def clear_load_cache() -> None:
+    """Forget all parsed metadata files cached by TableMetadata.load."""
+    _LOAD_CACHE.clear()
+
+
+def _first(d: dict[str, Any], keys: tuple[str, ...]) -> Any:
+    """Return the first truthy value among the given alias keys, or None."""
+    for k in keys:
+        v = d.get(k)
+        if v:
+            return v
+    return None
+
+
+# init=False keeps the hand-written constructor while repr, eq, fields(), asdict()
+# and replace() still come from dataclasses
+@dataclass(slots=True, init=False)
 class ColumnMetadata:
     """Metadata for a single column."""
 
@@ -17,20 +43,33 @@ class ColumnMetadata:
     nullable: bool = True
     is_primary_key: bool = False
 
+    def __init__(
+        self,
+        name: str,
+        data_type: str | None = None,
+        nullable: bool = True,
+        is_primary_key: bool = False,
+    ) -> None:
+        self.name = name
+        self.data_type = data_type
+        self.nullable = nullable
+        self.is_primary_key = is_primary_key
+
     @classmethod
     def from_dict(cls, d: dict[str, Any]) -> ColumnMetadata:
         name = d.get("name") or d.get("column_name")
         if not name:
             raise ValueError("Column must have 'name' or 'column_name'")
+        # Interned so matching source/target names compare by identity in set lookups
         return cls(
-            name=str(name).strip(),
+            name=sys.intern(str(name).strip()),
             data_type=d.get("data_type") or d.get("type"),
             nullable=d.get("nullable", True),
             is_primary_key=bool(d.get("is_primary_key", False)),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TableMetadata:
     """Metadata for a single table (schema + columns)."""
 
@@ -46,46 +85,88 @@ class TableMetadata:
             return f"{self.schema_name}.{self.table_name}"
         return self.table_name
 
+    @property
+    def quoted_qualified_name(self) -> str:
+        """Qualified name with ANSI double-quoted parts ("schema"."table" or table)."""
+        if self.schema_name:
+            return f'"{self.schema_name}"."{self.table_name}"'
+        return self.table_name
+
+    @property
+    def sqlserver_qualified_name(self) -> str:
+        """Qualified name in SQL Server bracket style ([schema].[table] or table)."""
+        if self.schema_name:
+            return f"[{self.schema_name}].[{self.table_name}]"
+        return self.table_name
+
     @property
     def key_columns(self) -> list[str]:
         """Column names to use as key for ordering/joining (PK or first column)."""
         if self.primary_key_columns:
-            return [c for c in self.primary_key_columns if c in self.column_names]
+            names = set(self.column_names)
+            return [c for c in self.primary_key_columns if c in names]
         pk_from_cols = [c.name for c in self.columns if c.is_primary_key]
         if pk_from_cols:
             return pk_from_cols
-        return self.column_names[:1] if self.column_names else []
+        return [self.columns[0].name] if self.columns else []
 
     @property
     def column_names(self) -> list[str]:
+        # Built per access so it tracks the columns; callers should bind it once
         return [c.name for c in self.columns]
 
     @classmethod
     def from_dict(cls, d: dict[str, Any]) -> TableMetadata:
-        table_name = d.get("table_name") or d.get("table") or d.get("name")
+        table_name = _first(d, ("table_name", "table", "name"))
         if not table_name:
             raise ValueError("Table must have 'table_name', 'table', or 'name'")
-        cols = d.get("columns", [])
-        if not cols and "column_names" in d:
-            cols = [{"name": n} for n in d["column_names"]]
-        columns = [ColumnMetadata.from_dict(c) for c in cols]
+        cols = d.get("columns")
+        if cols:
+            columns = [ColumnMetadata.from_dict(c) for c in cols]
+        elif "column_names" in d:
+            # Bare names need no per-column dict; validate as from_dict would
+            names = d["column_names"]
+            if not all(names):
+                raise ValueError("Column must have 'name' or 'column_name'")
+            columns = [ColumnMetadata(sys.intern(str(n).strip())) for n in names]
+        else:
+            columns = []
+        pk = _first(d, ("primary_key", "primary_key_columns"))
         return cls(
             table_name=str(table_name).strip(),
-            schema_name=d.get("schema_name") or d.get("schema"),
+            schema_name=_first(d, ("schema_name", "schema")),
             columns=columns,
-            primary_key_columns=d.get("primary_key") or d.get("primary_key_columns"),
+            # Copied so edits to the table never reach a cached source dict
+            primary_key_columns=list(pk) if pk else None,
         )
 
     @classmethod
     def load(cls, path: str | Path) -> TableMetadata:
-        """Load table metadata from a JSON file."""
+        """
+        Load table metadata from a JSON file.
+
+        Parsed JSON is cached per file until its mtime or size changes (see
+        clear_load_cache); every call still returns a new TableMetadata.
+        """
         path = Path(path)
-        if not path.exists():
-            raise FileNotFoundError(f"Metadata file not found: {path}")
-        text = path.read_text(encoding="utf-8")
-        data = json.loads(text)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Metadata file not found: {path}") from None
+        key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+        data = _LOAD_CACHE.get(key)
+        if data is not None:
+            return cls.from_dict(data)
+
+        data = _json_loads(path.read_bytes())
         if isinstance(data, list):
             data = {"table_name": "table", "columns": data}
         elif "columns" not in data and "column_names" not in data:
             raise ValueError("Metadata must contain 'columns' or 'column_names'")
-        return cls.from_dict(data)
+        table = cls.from_dict(data)
+
+        if len(_LOAD_CACHE) >= _LOAD_CACHE_MAXSIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del _LOAD_CACHE[next(iter(_LOAD_CACHE))]
+        _LOAD_CACHE[key] = data
+        return table
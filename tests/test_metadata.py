@@ -0,0 +1,85 @@
+"""Tests for metadata loading and the metadata classes."""
+
+import copy
+import dataclasses
+import pickle
+import unittest
+from pathlib import Path
+
+from src import metadata
+from src.metadata import ColumnMetadata, TableMetadata, clear_load_cache
+
+EXAMPLES = Path(__file__).resolve().parent.parent / "examples"
+
+
+class CopyAndPickleTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.column = ColumnMetadata("id", data_type="int", nullable=False, is_primary_key=True)
+        self.table = TableMetadata.load(EXAMPLES / "source_metadata.json")
+
+    def test_column_round_trips(self) -> None:
+        for clone in (
+            copy.copy(self.column),
+            copy.deepcopy(self.column),
+            pickle.loads(pickle.dumps(self.column)),
+        ):
+            self.assertIsNot(clone, self.column)
+            self.assertEqual(clone, self.column)
+
+    def test_table_round_trips(self) -> None:
+        for clone in (
+            copy.copy(self.table),
+            copy.deepcopy(self.table),
+            pickle.loads(pickle.dumps(self.table)),
+        ):
+            self.assertEqual(clone, self.table)
+            self.assertEqual(clone.column_names, self.table.column_names)
+            self.assertEqual(clone.qualified_name, self.table.qualified_name)
+
+    def test_dataclass_helpers(self) -> None:
+        renamed = dataclasses.replace(self.column, name="key")
+        self.assertEqual(renamed.name, "key")
+        self.assertEqual([f.name for f in dataclasses.fields(self.column)][0], "name")
+        as_dict = dataclasses.asdict(self.table)
+        self.assertEqual(as_dict["columns"][0]["name"], "id")
+
+
+class MutationTests(unittest.TestCase):
+    def test_derived_names_follow_edits(self) -> None:
+        table = TableMetadata("T")
+        table.schema_name = "s"
+        table.columns.append(ColumnMetadata("a"))
+        self.assertEqual(table.qualified_name, "s.T")
+        self.assertEqual(table.quoted_qualified_name, '"s"."T"')
+        self.assertEqual(table.sqlserver_qualified_name, "[s].[T]")
+        self.assertEqual(table.column_names, ["a"])
+        self.assertEqual(table.key_columns, ["a"])
+
+
+class LoadCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_load_cache()
+        self.path = EXAMPLES / "source_metadata.json"
+
+    def test_edits_do_not_leak_into_later_loads(self) -> None:
+        first = TableMetadata.load(self.path)
+        first.table_name = "X"
+        first.columns[0].name = "renamed"
+        first.columns.append(ColumnMetadata("extra"))
+        first.primary_key_columns.append("extra")
+
+        second = TableMetadata.load(self.path)
+        self.assertIsNot(second, first)
+        self.assertEqual(second.table_name, "Customers")
+        self.assertEqual(second.column_names, ["id", "name", "email", "created_at"])
+        self.assertEqual(second.primary_key_columns, ["id"])
+
+    def test_clear_load_cache(self) -> None:
+        TableMetadata.load(self.path)
+        self.assertEqual(len(metadata._LOAD_CACHE), 1)
+        clear_load_cache()
+        self.assertEqual(metadata._LOAD_CACHE, {})
+
+
+if __name__ == "__main__":
+    unittest.main()